@@ -50,7 +50,12 @@ from athenian.api.balancing import extract_handler_weight
 from athenian.api.cache import CACHE_VAR_NAME, setup_cache_metrics
 from athenian.api.controllers import invitation_controller
 from athenian.api.controllers.status_controller import setup_status
-from athenian.api.db import Database, add_pdb_metrics_context, measure_db_overhead_and_retry
+from athenian.api.db import (
+    Database,
+    add_pdb_metrics_context,
+    measure_db_overhead_and_retry,
+    postgres_pool_options,
+)
 from athenian.api.defer import (
     defer,
     enable_defer,
@@ -397,6 +402,8 @@ class AthenianApp(especifico.AioHttpApp):
 
         async def connect_to_db(name: str, shortcut: str, db_conn: str, db_options: dict):
             try:
+                if db_conn.startswith("postgresql"):
+                    db_options = {**postgres_pool_options, **(db_options or {})}
                 db = Database(db_conn, **(db_options or {}))
                 for i in range(attempts := 3):
                     try:
@@ -91,6 +91,15 @@ Row = Mapping[Union[int, str], Any]
 integrity_errors = (asyncpg.IntegrityConstraintViolationError, sqlite3.IntegrityError)
 """Possible integrity error exceptions according to used DB backends."""
 
+postgres_pool_options = {
+    # asyncpg keeps an LRU of PreparedStatement-s keyed by the SQL text in each connection.
+    # Our bulk INSERT ... ON CONFLICT statements are long, and there are many distinct ones,
+    # so the defaults (100 statements, 15 KiB each) force re-preparing in execute_many().
+    "statement_cache_size": 1024,
+    "max_cacheable_statement_size": 64 * 1024,
+}
+"""Default asyncpg pool options for PostgreSQL databases."""
+
 
 _sql_log = logging.getLogger("%s.sql" % metadata.__package__)
 _sql_str_re = re.compile(r"'[^']+'(, )?")
@@ -101,21 +110,22 @@ def _generate_tags() -> str:
     with sentry_sdk.configure_scope() as scope:
         if (transaction := scope.transaction) is None:
             return ""
-        values = [
-            f"application='{metadata.__package__}'",
-            f"framework='{metadata.__version__}'",
-            f"route='{quote(transaction.name)}'",
-            f"traceparent='{transaction.trace_id}'",
-            f"tracestate='{scope.span.span_id}'",
-        ]
+        tags = scope._tags
         try:
-            values.append(f"controller='{scope._tags['account']}'")
+            controller = f"controller='{tags['account']}',"
         except KeyError:
-            pass
-        values.append(
-            f"action='{';'.join(k for k, v in scope._tags.items() if isinstance(v, bool))}'",
+            controller = ""
+        action = ";".join(k for k, v in tags.items() if isinstance(v, bool))
+        # keep the keys sorted alphabetically
+        return (
+            f" /*action='{action}',"
+            f"application='{metadata.__package__}',"
+            f"{controller}"
+            f"framework='{metadata.__version__}',"
+            f"route='{quote(transaction.name)}',"
+            f"traceparent='{transaction.trace_id}',"
+            f"tracestate='{scope.span.span_id}'*/"
         )
-    return " /*" + ",".join(sorted(values)) + "*/"
 
 
 def _strip_rocket(query: str) -> str:
@@ -125,6 +135,9 @@ def _strip_rocket(query: str) -> str:
 
 
 async def _asyncpg_execute(self, query: str, args, limit, timeout, **kwargs):
+    if sentry_sdk.Hub.current.scope.transaction is None:
+        # nothing to trace, avoid the span overhead
+        return await self._execute_original(query, args, limit, timeout, **kwargs)
     description = log_query = _strip_rocket(query)
     if log_query.startswith("/*"):
         log_sql_probe = log_query[log_query.find("*/", 2, 1024) + 3 :]
@@ -138,7 +151,9 @@ async def _asyncpg_execute(self, query: str, args, limit, timeout, **kwargs):
         if len(description) >= MAX_SENTRY_STRING_LENGTH:
             transaction = sentry_sdk.Hub.current.scope.transaction
             if transaction is not None and transaction.sampled:
-                query_id = log_multipart(_sql_log, pickle.dumps((log_query, args)))
+                query_id = log_multipart(
+                    _sql_log, pickle.dumps((log_query, args), protocol=pickle.HIGHEST_PROTOCOL),
+                )
                 brief = _sql_str_re.sub("", log_query)
                 description = "%s\n%s" % (query_id, brief[:MAX_SENTRY_STRING_LENGTH])
     else:
@@ -161,6 +176,8 @@ async def _asyncpg_execute(self, query: str, args, limit, timeout, **kwargs):
 async def _asyncpg_executemany(self, query, args, timeout, **kwargs):
     if timeout is None:
         timeout = float(10 * 60)  # twice as much the default
+    if sentry_sdk.Hub.current.scope.transaction is None:
+        return await self._executemany_original(query, args, timeout, **kwargs)
     log_query = _strip_rocket(query)
     with sentry_sdk.start_span(op="sql", description=f"<= {len(args)}\n{log_query}"):
         return await self._executemany_original(query, args, timeout, **kwargs)
@@ -186,6 +203,7 @@ def measure_db_overhead_and_retry(
     Also retry queries after connectivity errors.
     """
     log = logging.getLogger("%s.measure_db_overhead_and_retry" % metadata.__package__)
+    elapsed_var = app["db_elapsed"] if app is not None else None  # type: Optional[ContextVar]
     backend_connection = db._backend.connection  # type: Callable[[], ConnectionBackend]
 
     def wrapped_backend_connection() -> ConnectionBackend:
@@ -250,13 +268,11 @@ def measure_db_overhead_and_retry(
                                         log.info("Disconnected from %s", db.url)
                             await asyncio.sleep(wait_time)
                         finally:
-                            if app is not None:
-                                elapsed = app["db_elapsed"].get()
-                                if elapsed is None:
+                            if elapsed_var is not None:
+                                if (elapsed := elapsed_var.get()) is None:
                                     log.warning("Cannot record the %s overhead", db_id)
                                 else:
-                                    delta = time.time() - start_time
-                                    elapsed[db_id] += delta
+                                    elapsed[db_id] += time.time() - start_time
 
                 if db.url.dialect == "sqlite":
                     return await execute()
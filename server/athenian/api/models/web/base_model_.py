@@ -71,22 +71,43 @@ class Model(metaclass=Slots):
             return {item[0]: cls.serialize(item[1]) for item in value.items()}
         return value
 
+    @classmethod
+    def _serialization_plan(cls) -> typing.Tuple[typing.Tuple[str, str, bool, bool], ...]:
+        """Return the cached attribute names, JSON keys, and whether to skip nulls and empties."""
+        # evaluated lazily: some models patch their `attribute_types` after the class definition
+        try:
+            return cls.__dict__["_serialization_plan_"]
+        except KeyError:
+            pass
+        plan = []
+        for attr_key, type_ in cls.attribute_types.items():
+            try:
+                skip_null = typing_utils.is_optional(type_)
+            except TypeError:
+                skip_null = False
+            skip_empty = skip_null and not getattr(type_.__origin__, "__verbatim__", False)
+            json_key = cls.attribute_map.get(attr_key, attr_key)
+            plan.append((attr_key, json_key, skip_null, skip_empty))
+        cls._serialization_plan_ = plan = tuple(plan)
+        return plan
+
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
         result = {}
+        serialize = self.serialize
 
-        for attr_key in self.attribute_types:
+        for attr_key, json_key, skip_null, skip_empty in self._serialization_plan():
             value = getattr(self, attr_key)
-            try:
-                if typing_utils.is_optional(type_ := self.attribute_types[attr_key]) and (
-                    value is None
-                    or (not getattr(type_.__origin__, "__verbatim__", False) and len(value) == 0)
-                ):
+            if skip_null:
+                if value is None:
                     continue
-            except TypeError:
-                pass
-            json_key = self.attribute_map.get(attr_key, attr_key)
-            result[json_key] = self.serialize(value)
+                if skip_empty:
+                    try:
+                        if len(value) == 0:
+                            continue
+                    except TypeError:
+                        pass
+            result[json_key] = serialize(value)
 
         return result
 
@@ -106,12 +106,11 @@ class CalculatedPullRequestMetrics(Model):
         """
         if metrics is None:
             raise ValueError("Invalid value for `metrics`, must not be `None`")
-        for m in metrics:
-            if m not in PullRequestMetricID:
-                raise ValueError(
-                    'Invalid value for `metrics`: "%s" must be one of %s' % m,
-                    list(PullRequestMetricID),
-                )
+        if invalid := [m for m in metrics if m not in PullRequestMetricID]:
+            raise ValueError(
+                "Invalid value for `metrics`: %s must be one of %s"
+                % (invalid, sorted(PullRequestMetricID)),
+            )
 
         self._metrics = metrics
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Optional, Type, TypeVar
+from itertools import chain
+import sys
+from typing import List, Optional, Tuple, Type, TypeVar
+
+import numpy as np
 
 from athenian.api.models.web.base_model_ import Model
 from athenian.api.models.web.jira_filter import JIRAFilter
@@ -8,9 +12,39 @@ from athenian.api.models.web.jira_filter import JIRAFilter
 ForSetLike = TypeVar("ForSetLike", bound=Model)
 
 
+_int64_info = np.iinfo(np.int64)
+
+
+def _flatten_repogroups(repogroups: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate the repository groups into one array and return it with the group lengths."""
+    lengths = np.fromiter((len(group) for group in repogroups), int, len(repogroups))
+    try:
+        flat = np.fromiter(chain.from_iterable(repogroups), np.int64, lengths.sum())
+    except OverflowError:
+        # saturate the client's huge numbers, they still compare the same with our bounds
+        flat = np.fromiter(
+            (
+                min(max(v, _int64_info.min), _int64_info.max)
+                for v in chain.from_iterable(repogroups)
+            ),
+            np.int64,
+            lengths.sum(),
+        )
+    return flat, lengths
+
+
+def _locate_repogroup_item(pos: int, lengths: np.ndarray) -> Tuple[int, int]:
+    """Convert the position in the flattened repogroups to (group index, index in group)."""
+    ends = np.cumsum(lengths)
+    i = np.searchsorted(ends, pos, side="right")
+    return int(i), int(pos - ends[i] + lengths[i])
+
+
 class RepositoryGroupsMixin:
     """Mixin to add support for `repositories` and `repogroups`."""
 
+    __slots__ = ()  # otherwise the models that inherit from us acquire __dict__
+
     @property
     def repositories(self) -> List[str]:
         """Gets the repositories of this ForSetPullRequests.
@@ -30,15 +64,15 @@ class RepositoryGroupsMixin:
         if len(repositories) == 0:
             raise ValueError("Invalid value for `repositories`, must not be an empty list")
         if self._repogroups is not None:
-            for i, group in enumerate(self._repogroups):
-                for j, v in enumerate(group):
-                    if v >= len(repositories):
-                        raise ValueError(
-                            "`repogroups[%d][%d]` = %s must be less than the number of "
-                            "repositories (%d)" % (i, j, v, len(repositories)),
-                        )
+            flat, lengths = _flatten_repogroups(self._repogroups)
+            if len(too_big := np.flatnonzero(flat >= len(repositories))):
+                i, j = _locate_repogroup_item(too_big[0], lengths)
+                raise ValueError(
+                    "`repogroups[%d][%d]` = %s must be less than the number of "
+                    "repositories (%d)" % (i, j, self._repogroups[i][j], len(repositories)),
+                )
 
-        self._repositories = repositories
+        self._repositories = [sys.intern(repo) for repo in repositories]
 
     @property
     def repogroups(self) -> Optional[List[List[int]]]:
@@ -57,21 +91,31 @@ class RepositoryGroupsMixin:
         if repogroups is not None:
             if len(repogroups) == 0:
                 raise ValueError("`repogroups` must contain at least one list")
-            for i, group in enumerate(repogroups):
-                if len(group) == 0:
-                    raise ValueError("`repogroups[%d]` must contain at least one element" % i)
-                for j, v in enumerate(group):
-                    if v < 0:
-                        raise ValueError(
-                            "`repogroups[%d][%d]` = %s must not be negative" % (i, j, v),
-                        )
-                    if self._repositories is not None and v >= len(self._repositories):
-                        raise ValueError(
-                            "`repogroups[%d][%d]` = %s must be less than the number of "
-                            "repositories (%d)" % (i, j, v, len(self._repositories)),
-                        )
-                if len(set(group)) < len(group):
-                    raise ValueError("`repogroups[%d]` has duplicate items" % i)
+            flat, lengths = _flatten_repogroups(repogroups)
+            if len(empty := np.flatnonzero(lengths == 0)):
+                raise ValueError("`repogroups[%d]` must contain at least one element" % empty[0])
+            if len(negative := np.flatnonzero(flat < 0)):
+                i, j = _locate_repogroup_item(negative[0], lengths)
+                raise ValueError(
+                    "`repogroups[%d][%d]` = %s must not be negative" % (i, j, repogroups[i][j]),
+                )
+            if self._repositories is not None and len(
+                too_big := np.flatnonzero(flat >= len(self._repositories)),
+            ):
+                i, j = _locate_repogroup_item(too_big[0], lengths)
+                raise ValueError(
+                    "`repogroups[%d][%d]` = %s must be less than the number of "
+                    "repositories (%d)" % (i, j, repogroups[i][j], len(self._repositories)),
+                )
+            group_indexes = np.repeat(np.arange(len(lengths)), lengths)
+            order = np.lexsort((flat, group_indexes))
+            flat = flat[order]
+            group_indexes = group_indexes[order]
+            duplicates = (flat[1:] == flat[:-1]) & (group_indexes[1:] == group_indexes[:-1])
+            if duplicates.any():
+                raise ValueError(
+                    "`repogroups[%d]` has duplicate items" % group_indexes[1:][duplicates][0],
+                )
 
         self._repogroups = repogroups
 
@@ -84,33 +128,39 @@ class RepositoryGroupsMixin:
             return fs
         if index >= len(self.repogroups):
             raise IndexError("%d is out of range (max is %d)" % (index, len(self.repogroups)))
-        fs.repogroups = None
-        fs.repositories = [self.repositories[i] for i in self.repogroups[index]]
+        # the indexes have already been validated, bypass the setters
+        fs._repogroups = None
+        fs._repositories = [self._repositories[i] for i in self._repogroups[index]]
         return fs
 
 
 def make_common_pull_request_filters(prefix_labels: str) -> Type[Model]:
     """Generate CommonPullRequestFilters class with the specified label properties name prefix."""
+    # bake the attribute names once instead of formatting them on each access
+    labels_include_name = prefix_labels + "labels_include"
+    labels_exclude_name = prefix_labels + "labels_exclude"
+    labels_include_attr = "_" + labels_include_name
+    labels_exclude_attr = "_" + labels_exclude_name
 
     class CommonPullRequestFilters(Model, sealed=False):
         """A few filters that are specific to filtering PR-related entities."""
 
         attribute_types = {
-            prefix_labels + "labels_include": Optional[List[str]],
-            prefix_labels + "labels_exclude": Optional[List[str]],
+            labels_include_name: Optional[List[str]],
+            labels_exclude_name: Optional[List[str]],
             "jira": Optional[JIRAFilter],
         }
 
         attribute_map = {
-            prefix_labels + "labels_include": prefix_labels + "labels_include",
-            prefix_labels + "labels_exclude": prefix_labels + "labels_exclude",
+            labels_include_name: labels_include_name,
+            labels_exclude_name: labels_exclude_name,
             "jira": "jira",
         }
 
         def __init__(self, **kwargs):
             """Will be overwritten later."""
-            setattr(self, li_name := f"_{prefix_labels}labels_include", kwargs.get(li_name[1:]))
-            setattr(self, le_name := f"_{prefix_labels}labels_exclude", kwargs.get(le_name[1:]))
+            setattr(self, labels_include_attr, kwargs.get(labels_include_name))
+            setattr(self, labels_exclude_attr, kwargs.get(labels_exclude_name))
             self._jira = kwargs.get("jira")
 
         def _get_labels_include(self) -> Optional[List[str]]:
@@ -118,28 +168,28 @@ def make_common_pull_request_filters(prefix_labels: str) -> Type[Model]:
 
             :return: The labels_include of this CommonPullRequestFilters.
             """
-            return getattr(self, f"_{prefix_labels}labels_include")
+            return getattr(self, labels_include_attr)
 
         def _set_labels_include(self, labels_include: Optional[List[str]]) -> None:
             """Sets the labels_include of this CommonPullRequestFilters.
 
             :param labels_include: The labels_include of this CommonPullRequestFilters.
             """
-            setattr(self, f"_{prefix_labels}labels_include", labels_include)
+            setattr(self, labels_include_attr, labels_include)
 
         def _get_labels_exclude(self) -> Optional[List[str]]:
             """Gets the labels_exclude of this CommonPullRequestFilters.
 
             :return: The labels_exclude of this CommonPullRequestFilters.
             """
-            return getattr(self, f"_{prefix_labels}labels_exclude")
+            return getattr(self, labels_exclude_attr)
 
         def _set_labels_exclude(self, labels_exclude: Optional[List[str]]) -> None:
             """Sets the labels_exclude of this CommonPullRequestFilters.
 
             :param labels_exclude: The labels_exclude of this CommonPullRequestFilters.
             """
-            setattr(self, f"_{prefix_labels}labels_exclude", labels_exclude)
+            setattr(self, labels_exclude_attr, labels_exclude)
 
         @property
         def jira(self) -> Optional[JIRAFilter]:
@@ -168,7 +218,7 @@ def make_common_pull_request_filters(prefix_labels: str) -> Type[Model]:
 
     setattr(
         CommonPullRequestFilters,
-        prefix_labels + "labels_include",
+        labels_include_name,
         property(
             CommonPullRequestFilters._get_labels_include,
             CommonPullRequestFilters._set_labels_include,
@@ -176,7 +226,7 @@ def make_common_pull_request_filters(prefix_labels: str) -> Type[Model]:
     )
     setattr(
         CommonPullRequestFilters,
-        prefix_labels + "labels_exclude",
+        labels_exclude_name,
         property(
             CommonPullRequestFilters._get_labels_exclude,
             CommonPullRequestFilters._set_labels_exclude,
@@ -239,9 +289,13 @@ class ForSetLines(Model, RepositoryGroupsMixin, sealed=False):
                 raise ValueError("`lines` must contain at least 2 elements")
             if lines[0] < 0:
                 raise ValueError("all elements of `lines` must be non-negative")
-            for i, val in enumerate(lines[:-1]):
-                if val >= lines[i + 1]:
-                    raise ValueError("`lines` must monotonically increase")
+            try:
+                increasing = (np.diff(np.asarray(lines, dtype=np.int64)) > 0).all()
+            except OverflowError:
+                # the client sent numbers beyond int64, compare them in Python
+                increasing = all(a < b for a, b in zip(lines, lines[1:]))
+            if not increasing:
+                raise ValueError("`lines` must monotonically increase")
         self._lines = lines
 
     def select_lines(self, index: int) -> ForSetLines:
@@ -253,5 +307,6 @@ class ForSetLines(Model, RepositoryGroupsMixin, sealed=False):
             return fs
         if index >= len(self.lines) - 1:
             raise IndexError("%d is out of range (max is %d)" % (index, len(self.lines) - 1))
-        fs.lines = [fs.lines[index], fs.lines[index + 1]]
+        # the range has already been validated, bypass the setter
+        fs._lines = self._lines[index : index + 2]
         return fs
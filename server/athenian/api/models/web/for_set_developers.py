@@ -1,3 +1,4 @@
+import sys
 from typing import List, Optional
 
 from athenian.api.models.web.base_model_ import AllOf, Model
@@ -59,7 +60,7 @@ class _ForSetDevelopers(Model, RepositoryGroupsMixin, sealed=False):
         if len(developers) == 0:
             raise ValueError("Invalid value for `developers`, must not be an empty list")
 
-        self._developers = developers
+        self._developers = [sys.intern(dev) for dev in developers]
 
     @property
     def aggregate_devgroups(self) -> Optional[List[List[int]]]:
@@ -155,119 +155,136 @@ class GenericError(Model):
 class BadRequestError(GenericError):
     """HTTP 400."""
 
+    _TITLE = HTTPStatus.BAD_REQUEST.phrase
+    _STATUS = HTTPStatus.BAD_REQUEST.value
+
     def __init__(self, detail: Optional[str] = None):
         """Initialize a new instance of BadRequestError.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type="/errors/BadRequest",
-            title=HTTPStatus.BAD_REQUEST.phrase,
-            status=HTTPStatus.BAD_REQUEST,
-            detail=detail,
-        )
+        self._type = "/errors/BadRequest"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class NotFoundError(GenericError):
     """HTTP 404."""
 
+    _TITLE = HTTPStatus.NOT_FOUND.phrase
+    _STATUS = HTTPStatus.NOT_FOUND.value
+
     def __init__(self, detail: Optional[str] = None, type_: str = "/errors/NotFoundError"):
         """Initialize a new instance of NotFoundError.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type=type_,
-            title=HTTPStatus.NOT_FOUND.phrase,
-            status=HTTPStatus.NOT_FOUND,
-            detail=detail,
-        )
+        self._type = type_
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class ForbiddenError(GenericError):
     """HTTP 403."""
 
+    _TITLE = HTTPStatus.FORBIDDEN.phrase
+    _STATUS = HTTPStatus.FORBIDDEN.value
+
     def __init__(self, detail: Optional[str] = None):
         """Initialize a new instance of ForbiddenError.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type="/errors/ForbiddenError",
-            title=HTTPStatus.FORBIDDEN.phrase,
-            status=HTTPStatus.FORBIDDEN,
-            detail=detail,
-        )
+        self._type = "/errors/ForbiddenError"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class UnauthorizedError(GenericError):
     """HTTP 401."""
 
+    _TITLE = HTTPStatus.UNAUTHORIZED.phrase
+    _STATUS = HTTPStatus.UNAUTHORIZED.value
+
     def __init__(self, detail: Optional[str] = None):
         """Initialize a new instance of UnauthorizedError.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type="/errors/Unauthorized",
-            title=HTTPStatus.UNAUTHORIZED.phrase,
-            status=HTTPStatus.UNAUTHORIZED,
-            detail=detail,
-        )
+        self._type = "/errors/Unauthorized"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class DatabaseConflict(GenericError):
     """HTTP 409."""
 
+    _TITLE = HTTPStatus.CONFLICT.phrase
+    _STATUS = HTTPStatus.CONFLICT.value
+
     def __init__(self, detail: Optional[str] = None):
         """Initialize a new instance of DatabaseConflict.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type="/errors/DatabaseConflict",
-            title=HTTPStatus.CONFLICT.phrase,
-            status=HTTPStatus.CONFLICT,
-            detail=detail,
-        )
+        self._type = "/errors/DatabaseConflict"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class TooManyRequestsError(GenericError):
     """HTTP 429."""
 
+    _TITLE = HTTPStatus.TOO_MANY_REQUESTS.phrase
+    _STATUS = HTTPStatus.TOO_MANY_REQUESTS.value
+
     def __init__(self, detail: Optional[str] = None, type="/errors/TooManyRequestsError"):
         """Initialize a new instance of TooManyRequestsError.
 
         :param detail: The details about this error.
         :param type: The type identifier of this error.
         """
-        super().__init__(
-            type=type,
-            title=HTTPStatus.TOO_MANY_REQUESTS.phrase,
-            status=HTTPStatus.TOO_MANY_REQUESTS,
-            detail=detail,
-        )
+        self._type = type
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class ServerNotImplementedError(GenericError):
     """HTTP 501."""
 
+    _TITLE = HTTPStatus.NOT_IMPLEMENTED.phrase
+    _STATUS = HTTPStatus.NOT_IMPLEMENTED.value
+
     def __init__(self, detail="This API endpoint is not implemented yet."):
         """Initialize a new instance of ServerNotImplementedError.
 
         :param detail: The details about this error.
         """
-        super().__init__(
-            type="/errors/NotImplemented",
-            title=HTTPStatus.NOT_IMPLEMENTED.phrase,
-            status=HTTPStatus.NOT_IMPLEMENTED,
-            detail=detail,
-        )
+        self._type = "/errors/NotImplemented"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = None
 
 
 class ServiceUnavailableError(GenericError):
     """HTTP 503."""
 
+    _TITLE = HTTPStatus.SERVICE_UNAVAILABLE.phrase
+    _STATUS = HTTPStatus.SERVICE_UNAVAILABLE.value
+
     def __init__(self, type: str, detail: Optional[str], instance: Optional[str] = None):
         """Initialize a new instance of ServiceUnavailableError.
 
@@ -275,10 +292,8 @@ class ServiceUnavailableError(GenericError):
         :param type: The type identifier of this error.
         :param instance: Sentry event ID of this error.
         """
-        super().__init__(
-            type=type,
-            title=HTTPStatus.SERVICE_UNAVAILABLE.phrase,
-            status=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail=detail,
-            instance=instance,
-        )
+        self._type = type
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = instance
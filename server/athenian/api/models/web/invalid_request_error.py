@@ -7,10 +7,11 @@ from athenian.api.models.web.generic_error import GenericError
 class InvalidRequestError(GenericError):
     """This class is auto generated by OpenAPI Generator (https://openapi-generator.tech)."""
 
-    attribute_types = GenericError.attribute_types.copy()
-    attribute_types["pointer"] = str
-    attribute_map = GenericError.attribute_map.copy()
-    attribute_map["pointer"] = "pointer"
+    attribute_types = {**GenericError.attribute_types, "pointer": str}
+    attribute_map = {**GenericError.attribute_map, "pointer": "pointer"}
+
+    _TITLE = HTTPStatus.BAD_REQUEST.phrase
+    _STATUS = HTTPStatus.BAD_REQUEST.value
 
     def __init__(
         self,
@@ -26,13 +27,11 @@ class InvalidRequestError(GenericError):
         :param instance: The instance of this InvalidRequestError.
         :param pointer: The pointer of this InvalidRequestError.
         """
-        super().__init__(
-            type="/errors/InvalidRequestError",
-            title=HTTPStatus.BAD_REQUEST.phrase,
-            status=HTTPStatus.BAD_REQUEST,
-            detail=detail,
-            instance=instance,
-        )
+        self._type = "/errors/InvalidRequestError"
+        self._title = self._TITLE
+        self._status = self._STATUS
+        self._detail = detail
+        self._instance = instance
         self._pointer = pointer
 
     @property
@@ -72,6 +72,11 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--uvloop", action="store_true", help="Use the uvloop asyncio loop implementation",
     )
+    parser.add_argument(
+        "--no-db-retry",
+        action="store_true",
+        help="Do not wrap the DB connections to retry the queries after connectivity errors",
+    )
 
     subparsers = parser.add_subparsers(dest="command")
     subparsers.add_parser("sync-labels", help="Update the labels in the precomputed PRs")
@@ -105,7 +110,19 @@ def _parse_args() -> argparse.Namespace:
     accounts_parser.add_argument(
         "--timeout", type=int, default=20 * 60, help="Maximum processing time for one account",
     )
-    return parser.parse_args()
+    accounts_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of reposets to precompute simultaneously with --disable-isolation",
+    )
+    args = parser.parse_args()
+    if args.command == "accounts":
+        if args.concurrency < 1:
+            parser.error("--concurrency must be at least 1")
+        if args.concurrency > 1 and not args.disable_isolation:
+            parser.error("--concurrency > 1 requires --disable-isolation")
+    return args
 
 
 def _main() -> int:
@@ -12,6 +12,7 @@ import traceback
 from typing import Callable, Optional, Sequence
 
 import aiomcache
+import numpy as np
 import sentry_sdk
 import sqlalchemy as sa
 from sqlalchemy import insert, update
@@ -19,7 +20,7 @@ from tqdm import tqdm
 
 from athenian.api.async_utils import gather
 from athenian.api.db import Database, dialect_specific_insert
-from athenian.api.defer import defer, wait_deferred
+from athenian.api.defer import defer, wait_deferred, with_defer
 from athenian.api.internal.account import copy_teams_as_needed, get_multiple_metadata_account_ids
 from athenian.api.internal.account_feature import is_feature_enabled
 from athenian.api.internal.features.entries import MetricEntriesCalculator
@@ -65,13 +66,25 @@ async def main(context: PrecomputeContext, args: argparse.Namespace) -> Optional
     context.log.info("Heating %d reposets", len(to_precompute))
     failed = 0
     log = context.log
-
-    for reposet_to_precompute in tqdm(to_precompute):
+    # the reposets spend most of the time waiting for the DBs, so we can overlap them
+    semaphore = asyncio.Semaphore(args.concurrency)
+    in_process_reposets = []
+    if not isolate and context.cache is not None:
+        await _warm_prefixers(to_precompute, context)
+
+    # disable=None turns the bar off when stderr is not a TTY
+    for reposet_to_precompute in (
+        tqdm(to_precompute, disable=None, mininterval=5) if isolate else to_precompute
+    ):
         reposet = reposet_to_precompute.reposet
         if not (meta_ids := reposet_to_precompute.meta_ids):
             log.error("Reposet owner account %d is not installed", reposet.owner_id)
             continue
 
+        if not isolate:
+            in_process_reposets.append((reposet, meta_ids))
+            continue
+
         duration_tracker = _DurationTracker(args.prometheus_pushgateway, context.log)
         status_tracker = _StatusTracker(args.prometheus_pushgateway, context.log)
 
@@ -84,16 +97,6 @@ async def main(context: PrecomputeContext, args: argparse.Namespace) -> Optional
 
         _set_sentry_scope(reposet)
 
-        if not isolate:
-            try:
-                await precompute_reposet(
-                    reposet, meta_ids, context, args, time_to, no_time_from, time_from,
-                )
-            except Exception:
-                track_failure()
-            else:
-                track_success()
-            continue
         pid = os.fork()
         if pid == 0:
             log.info("sandbox %d (account %d)", os.getpid(), reposet.owner_id)
@@ -138,9 +141,91 @@ async def main(context: PrecomputeContext, args: argparse.Namespace) -> Optional
                 else:
                     track_success()
 
+    if in_process_reposets:
+        # advance the bar as the reposets finish rather than as we schedule them
+        with tqdm(total=len(in_process_reposets), disable=None, mininterval=5) as progress:
+            failed = sum(
+                await gather(
+                    *(
+                        _precompute_reposet_in_process(
+                            reposet,
+                            meta_ids,
+                            context,
+                            args,
+                            time_to,
+                            no_time_from,
+                            time_from,
+                            semaphore,
+                            progress,
+                        )
+                        for reposet, meta_ids in in_process_reposets
+                    ),
+                ),
+            )
     log.info("failed: %d / %d", failed, len(to_precompute))
 
 
+# each concurrent reposet must wait_deferred() only for its own deferred tasks
+@with_defer
+async def _precompute_reposet_in_process(
+    reposet: RepositorySet,
+    meta_ids: tuple[int, ...],
+    context: PrecomputeContext,
+    args: argparse.Namespace,
+    time_to: datetime,
+    no_time_from: datetime,
+    time_from: datetime,
+    semaphore: asyncio.Semaphore,
+    progress: tqdm,
+) -> bool:
+    """Execute precompute_reposet() without sandboxing and return whether it failed."""
+    # the concurrent reposets must not overwrite each other's Sentry tags
+    with sentry_sdk.Hub(sentry_sdk.Hub.current), sentry_sdk.push_scope():
+        async with semaphore:
+            duration_tracker = _DurationTracker(args.prometheus_pushgateway, context.log)
+            status_tracker = _StatusTracker(args.prometheus_pushgateway, context.log)
+            _set_sentry_scope(reposet)
+            try:
+                await precompute_reposet(
+                    reposet, meta_ids, context, args, time_to, no_time_from, time_from,
+                )
+            except Exception:
+                status_tracker.track_failure(reposet.owner_id, meta_ids, not reposet.precomputed)
+                return True
+            finally:
+                progress.update()
+            duration_tracker.track(reposet.owner_id, meta_ids, not reposet.precomputed)
+            status_tracker.track_success(reposet.owner_id, meta_ids, not reposet.precomputed)
+            return False
+
+
+async def _warm_prefixers(
+    to_precompute: Sequence["RepoSetToPrecompute"],
+    context: PrecomputeContext,
+    concurrency: int = 8,
+) -> None:
+    """
+    Load the prefixers of all the reposets to memcached in parallel.
+
+    This is best-effort: precompute_reposet() loads the prefixer again if warming fails.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def warm(meta_ids: tuple[int, ...]) -> None:
+        async with semaphore:
+            try:
+                await Prefixer.load(meta_ids, context.mdb, context.cache)
+            except Exception as e:
+                context.log.warning(
+                    "failed to warm the prefixer of %s: %s: %s", meta_ids, type(e).__name__, e,
+                )
+
+    await gather(
+        *(warm(r.meta_ids) for r in to_precompute if r.meta_ids),
+        op="_warm_prefixers",
+    )
+
+
 @dataclass(frozen=True)
 class RepoSetToPrecompute:
     """A repository set to precompute."""
@@ -267,12 +352,17 @@ async def precompute_reposet(
             with_pr_titles=False,
             with_deployments=False,
         )
-        releases_by_tag = sum(1 for r in releases if r[1].matched_by == ReleaseMatch.tag)
-        releases_by_branch = sum(1 for r in releases if r[1].matched_by == ReleaseMatch.branch)
+        release_matches = np.fromiter(
+            (r[1].matched_by for r in releases), np.int8, len(releases),
+        )
+        releases_by_tag = int(np.count_nonzero(release_matches == ReleaseMatch.tag))
+        releases_by_branch = int(np.count_nonzero(release_matches == ReleaseMatch.branch))
+        del release_matches
         releases_count = len(releases)
         ignored_first_releases, ignored_released_prs = discover_first_outlier_releases(releases)
-        del releases
+        del releases  # free the memory before mining the PR facts
         _release_settings = ReleaseLoader.disambiguate_release_settings(release_settings, matches)
+        del matches
         if reposet.precomputed:
             log.info("Scanning for force push dropped PRs")
             await delete_force_push_dropped_prs(
@@ -306,11 +396,13 @@ async def precompute_reposet(
         )
         if not reposet.precomputed and slack is not None:
             prs = len(facts)
-            prs_done = facts[PullRequestFacts.f.done].sum()
-            prs_merged = (
-                facts[PullRequestFacts.f.merged].notnull() & ~facts[PullRequestFacts.f.done]
-            ).sum()
-            prs_open = facts[PullRequestFacts.f.closed].isnull().sum()
+            done = facts[PullRequestFacts.f.done].values
+            prs_done = int(np.count_nonzero(done))
+            prs_merged = int(
+                np.count_nonzero(facts[PullRequestFacts.f.merged].notnull().values & ~done),
+            )
+            prs_open = int(np.count_nonzero(facts[PullRequestFacts.f.closed].isnull().values))
+            del done
         del facts  # free some memory
         await wait_deferred()
         await hide_first_releases(
@@ -14,7 +14,7 @@ from slack_sdk.web.async_client import AsyncWebClient as SlackWebClient
 from athenian.api.__main__ import create_memcached, create_slack
 from athenian.api.async_utils import gather
 from athenian.api.cache import CACHE_VAR_NAME, setup_cache_metrics
-from athenian.api.db import Database, measure_db_overhead_and_retry
+from athenian.api.db import Database, measure_db_overhead_and_retry, postgres_pool_options
 from athenian.api.defer import enable_defer
 from athenian.api.models.metadata import dereference_schemas as dereference_metadata_schemas
 from athenian.api.models.persistentdata import (
@@ -24,6 +24,12 @@ from athenian.api.prometheus import PROMETHEUS_REGISTRY_VAR_NAME
 from athenian.precomputer.db import dereference_schemas as dereference_precomputed_schemas
 
 
+def _create_db(url: str) -> Database:
+    if url.startswith("postgresql"):
+        return Database(url, **postgres_pool_options)
+    return Database(url)
+
+
 @dataclass(slots=True)
 class PrecomputeContext:
     """Everything initialized for a command to execute."""
@@ -45,13 +51,15 @@ class PrecomputeContext:
             setup_cache_metrics({CACHE_VAR_NAME: cache, PROMETHEUS_REGISTRY_VAR_NAME: None})
             for v in cache.metrics["context"].values():
                 v.set(defaultdict(int))
-            sdb = measure_db_overhead_and_retry(Database(args.state_db))
+            # --no-db-retry disables retrying the queries after connectivity errors
+            wrap_db = (lambda db: db) if args.no_db_retry else measure_db_overhead_and_retry
+            sdb = wrap_db(_create_db(args.state_db))
             try:
-                mdb = measure_db_overhead_and_retry(Database(args.metadata_db))
+                mdb = wrap_db(_create_db(args.metadata_db))
                 try:
-                    pdb = measure_db_overhead_and_retry(Database(args.precomputed_db))
+                    pdb = wrap_db(_create_db(args.precomputed_db))
                     try:
-                        rdb = measure_db_overhead_and_retry(Database(args.persistentdata_db))
+                        rdb = wrap_db(_create_db(args.persistentdata_db))
                         try:
                             await gather(
                                 sdb.connect(), mdb.connect(), pdb.connect(), rdb.connect(),
@@ -29,7 +29,7 @@ async def main(
     log.info("Checking progress of %d accounts", len(accounts))
 
     discovered: Dict[str, List[int]] = {"precomputed": [], "fresh": []}
-    for account, precomputed in tqdm(accounts):
+    for account, precomputed in tqdm(accounts, disable=None, mininterval=5):
         state = await load_account_state(
             account, sdb, context.mdb, context.cache, context.slack, log=log,
         )
@@ -1,4 +1,5 @@
 import argparse
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from itertools import chain
 
@@ -35,7 +36,9 @@ async def main(context: PrecomputeContext, args: argparse.Namespace) -> None:
         ),
         *(get_metadata_account_ids_or_empty(acc, sdb, cache) for acc in accounts),
     )
-    users = dict(user_rows)
+    users = defaultdict(list)
+    for account_id, user_id in user_rows:
+        users[account_id].append(user_id)
     name_rows = await mdb.fetch_all(
         select(GitHubAccount.id, GitHubAccount.name).where(
             GitHubAccount.id.in_(chain.from_iterable(meta_ids)),
@@ -52,7 +55,7 @@ async def main(context: PrecomputeContext, args: argparse.Namespace) -> None:
                 "almost_expired.jinja2",
                 account=acc,
                 name=names[acc],
-                user=users.get(acc, "<no admin user>"),
+                user=", ".join(sorted(users.get(acc, ()))) or "<no admin user>",
                 expires=ensure_db_datetime_tz(expires, sdb),
             )
             for acc, expires in accounts.items()
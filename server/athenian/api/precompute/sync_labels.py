@@ -7,7 +7,7 @@ import numpy as np
 from sqlalchemy import and_, func, select, update
 from tqdm import tqdm
 
-from athenian.api.async_utils import gather
+from athenian.api.async_utils import gather, read_sql_query
 from athenian.api.internal.miners.github.dag_accelerated import searchsorted_inrange
 from athenian.api.models.metadata.github import NodePullRequest, PullRequestLabel
 from athenian.api.models.precomputed.models import (
@@ -15,93 +15,134 @@ from athenian.api.models.precomputed.models import (
     GitHubMergedPullRequestFacts,
 )
 from athenian.api.precompute.context import PrecomputeContext
+from athenian.api.unordered_unique import unordered_unique
+
+
+update_chunk_size = 10_000
 
 
 async def main(context: PrecomputeContext, args: argparse.Namespace) -> None:
     """Update the labels in the precomputed PRs."""
     log, mdb, pdb = context.log, context.mdb, context.pdb
-    tasks = []
-    all_prs = await mdb.fetch_all(select([NodePullRequest.id, NodePullRequest.acc_id]))
+    all_prs = await read_sql_query(
+        select([NodePullRequest.id, NodePullRequest.acc_id]),
+        mdb,
+        [NodePullRequest.id, NodePullRequest.acc_id],
+    )
     log.info("There are %d PRs in mdb", len(all_prs))
-    all_node_ids = np.fromiter((pr[0] for pr in all_prs), int, len(all_prs))
-    all_accounts = np.fromiter((pr[1] for pr in all_prs), np.uint32, len(all_prs))
+    all_node_ids = all_prs[NodePullRequest.id.name].values.astype(np.int64, copy=False)
+    all_accounts = all_prs[NodePullRequest.acc_id.name].values
     del all_prs
-    order = np.argsort(all_node_ids)
-    all_node_ids = all_node_ids[order]
-    all_accounts = all_accounts[order]
-    del order
+    # we only need the accounts of a few PRs, so do not permute the whole column
+    all_order = np.argsort(all_node_ids)
+    all_node_ids = all_node_ids[all_order]
     all_pr_times = await pdb.fetch_all(
         select([GitHubDonePullRequestFacts.pr_node_id, GitHubDonePullRequestFacts.labels]),
     )
     all_merged = await pdb.fetch_all(
         select([GitHubMergedPullRequestFacts.pr_node_id, GitHubMergedPullRequestFacts.labels]),
     )
-    unique_prs = np.unique(np.array([pr[0] for pr in chain(all_pr_times, all_merged)]))
+    unique_prs = np.unique(
+        np.fromiter(
+            (pr[0] for pr in chain(all_pr_times, all_merged)),
+            np.int64,
+            len(all_pr_times) + len(all_merged),
+        ),
+    )
     found_account_indexes = searchsorted_inrange(all_node_ids, unique_prs)
-    found_mask = all_node_ids[found_account_indexes] == unique_prs
-    unique_prs = unique_prs[found_mask]
-    unique_pr_acc_ids = all_accounts[found_account_indexes[found_mask]]
+    found_mask = np.take(all_node_ids, found_account_indexes) == unique_prs
+    unique_prs = np.compress(found_mask, unique_prs)
+    # the order of the accounts does not matter, hash instead of sorting
+    unique_acc_ids = unordered_unique(
+        np.take(all_accounts, np.take(all_order, np.compress(found_mask, found_account_indexes))),
+    )
     del found_mask
     del found_account_indexes
     del all_node_ids
     del all_accounts
+    del all_order
     if (prs_count := len(unique_prs)) == 0:
         return
-    log.info("Querying labels in %d PRs", prs_count)
-    order = np.argsort(unique_pr_acc_ids)
-    unique_prs = unique_prs[order]
-    unique_pr_acc_ids = unique_pr_acc_ids[order]
-    del order
-    unique_acc_ids, acc_id_counts = np.unique(unique_pr_acc_ids, return_counts=True)
-    del unique_pr_acc_ids
-    node_id_by_acc_id = np.split(unique_prs, np.cumsum(acc_id_counts))
-    del unique_prs
-    del acc_id_counts
-    for acc_id, node_ids in zip(unique_acc_ids, node_id_by_acc_id):
-        tasks.append(
-            mdb.fetch_all(
-                select(
-                    [PullRequestLabel.pull_request_node_id, func.lower(PullRequestLabel.name)],
-                ).where(
-                    and_(
-                        PullRequestLabel.pull_request_node_id.in_(node_ids),
-                        PullRequestLabel.acc_id == int(acc_id),
-                    ),
-                ),
+    log.info("Querying labels in %d PRs of %d accounts", prs_count, len(unique_acc_ids))
+    labels_df = await read_sql_query(
+        select(
+            [
+                PullRequestLabel.pull_request_node_id,
+                func.lower(PullRequestLabel.name).label(PullRequestLabel.name.name),
+            ],
+        )
+        .where(
+            and_(
+                PullRequestLabel.acc_id.in_(unique_acc_ids),
+                PullRequestLabel.pull_request_node_id.in_any_values(unique_prs),
             ),
         )
+        .with_statement_hint("Leading(*VALUES* prl label repo)"),
+        mdb,
+        [PullRequestLabel.pull_request_node_id, PullRequestLabel.name],
+    )
     del unique_acc_ids
-    del node_id_by_acc_id
-    task_results = await gather(*tasks)
-    actual_labels = defaultdict(dict)
-    for row in chain.from_iterable(task_results):
-        actual_labels[row[0]][row[1]] = ""
+    del unique_prs
+    # group the label names by PR over the sorted node IDs instead of hashing each row
+    label_node_ids = labels_df[PullRequestLabel.pull_request_node_id.name].values
+    label_names = labels_df[PullRequestLabel.name.name].values
+    del labels_df
+    order = np.argsort(label_node_ids)
+    label_node_ids = label_node_ids[order]
+    label_names = label_names[order]
+    del order
+    label_node_ids, label_offsets = np.unique(label_node_ids, return_index=True)
+    label_offsets = np.append(label_offsets, len(label_names)).tolist()
+    actual_labels = {
+        node_id: frozenset(label_names[beg:end])
+        for node_id, beg, end in zip(
+            label_node_ids.tolist(), label_offsets[:-1], label_offsets[1:],
+        )
+    }
+    del label_node_ids, label_offsets, label_names
     log.info("Loaded labels for %d PRs", len(actual_labels))
-    tasks = []
+    # group the PRs by the new labels to update many of them in one statement
+    updates = defaultdict(list)
+    no_labels = frozenset()
     for rows, model in (
         (all_pr_times, GitHubDonePullRequestFacts),
         (all_merged, GitHubMergedPullRequestFacts),
     ):
+        if not rows:
+            continue
+        assert isinstance(rows[0][1], dict)
         for row in rows:
-            assert isinstance(row[1], dict)
-            if (pr_labels := actual_labels.get(row[0], {})) != row[1]:
-                tasks.append(
-                    pdb.execute(
-                        update(model)
-                        .where(model.pr_node_id == row[0])
-                        .values(
-                            {
-                                model.labels: pr_labels,
-                                model.updated_at: datetime.now(timezone.utc),
-                            },
-                        ),
-                    ),
-                )
-    if not tasks:
+            # dict_keys compare with sets in C without building a new set
+            if (pr_labels := actual_labels.get(node_id := row[0], no_labels)) != row[1].keys():
+                updates[(model, pr_labels)].append(node_id)
+    if not updates:
         return
-    log.info("Updating %d records", len(tasks))
-    batch_size = 1000
-    bar = tqdm(total=len(tasks))
+    log.info(
+        "Updating %d records with %d label sets",
+        sum(len(node_ids) for node_ids in updates.values()),
+        len(updates),
+    )
+    now = datetime.now(timezone.utc)
+    tasks = []
+    for (model, labels), node_ids in updates.items():
+        # sorted IDs follow the primary key index; bounded chunks keep the statements small
+        node_ids = np.sort(np.array(node_ids, dtype=int))
+        labels = dict.fromkeys(labels, "")
+        for chunk_start in range(0, len(node_ids), update_chunk_size):
+            tasks.append(
+                pdb.execute(
+                    update(model)
+                    .where(
+                        model.pr_node_id.in_any_values(
+                            node_ids[chunk_start : chunk_start + update_chunk_size],
+                        ),
+                    )
+                    .values({model.labels: labels, model.updated_at: now}),
+                ),
+            )
+    del updates
+    batch_size = 100
+    bar = tqdm(total=len(tasks), disable=None, mininterval=5)
     try:
         while tasks:
             batch, tasks = tasks[:batch_size], tasks[batch_size:]
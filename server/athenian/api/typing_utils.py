@@ -1,6 +1,7 @@
 import dataclasses
 from datetime import datetime, timedelta
 from itertools import chain
+import pickle
 import sys
 from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Optional, TypeVar, Union
 
@@ -70,12 +71,12 @@ def is_generic(klass: type):
 
 def is_dict(klass: type):
     """Determine whether klass is a dict."""
-    return getattr(klass, "__origin__", None) == dict
+    return getattr(klass, "__origin__", None) is dict
 
 
 def is_list(klass: type):
     """Determine whether klass is a list."""
-    return getattr(klass, "__origin__", None) == list
+    return getattr(klass, "__origin__", None) is list
 
 
 def is_union(klass: type):
@@ -120,6 +121,10 @@ class NumpyStruct(Mapping[str, Any]):
 
     dtype: np.dtype
     nested_dtypes: Mapping[str, np.dtype]
+    # (field name, field dtype, nested dtype or None, is nested string, nested char size or 0)
+    _packing_plan: tuple[tuple[str, np.dtype, Optional[np.dtype], bool, int], ...]
+    # __slots__ without "_data" and "_arr"
+    _optional_fields: tuple[str, ...]
 
     def __init__(self, data: Union[bytes, bytearray, memoryview, np.ndarray], **optional: Any):
         """Initialize a new instance of NumpyStruct from raw memory and the (perhaps incomplete) \
@@ -132,7 +137,7 @@ class NumpyStruct(Mapping[str, Any]):
         else:
             self._data = data
             self._arr = None
-        for attr in self.__slots__[2:]:
+        for attr in self._optional_fields:
             setattr(self, attr, optional.get(attr))
 
     @classmethod
@@ -142,47 +147,35 @@ class NumpyStruct(Mapping[str, Any]):
         arr = np.zeros(1, cls.dtype)
         extra_bytes = []
         offset = cls.dtype.itemsize
-        for field_name, (field_dtype, _) in cls.dtype.fields.items():
+        for field_name, field_dtype, nested_dtype, is_str, char_size in cls._packing_plan:
             value = kwargs.pop(field_name)
-            try:
-                nested_dtype = cls.nested_dtypes[field_name]
-            except KeyError:
+            if nested_dtype is None:
                 if value is None and field_dtype.char in ("S", "U"):
                     value = ""
                 if field_dtype.char == "M" and isinstance(value, datetime):
                     value = value.replace(tzinfo=None)
                 arr[field_name] = np.asarray(value, field_dtype)
-            else:
-                if is_str := (
-                    (is_ascii := _dtype_is_ascii(nested_dtype)) or nested_dtype.char in ("S", "U")
-                ):
-                    if isinstance(value, np.ndarray):
-                        if value.dtype == np.dtype(object):
-                            nan_mask = value == np.array([None])
-                        else:
-                            nan_mask = np.full(len(value), False)
-                    else:
-                        nan_mask = np.fromiter(
-                            (v is None for v in value), dtype=np.bool_, count=len(value),
-                        )
-                    if is_ascii:
-                        nested_dtype = np.dtype("S")
-                value = np.asarray(value, nested_dtype)
-                assert len(value.shape) == 1, "we don't support arrays of more than 1 dimension"
-                if is_str and nan_mask.any():
-                    if not value.flags.writeable:
-                        value = value.copy()
-                    value[nan_mask] = ""
-                extra_bytes.append(data := value.view(np.byte).data)
-                pointer = [offset, len(value)]
-                if is_str and (is_ascii or nested_dtype.itemsize == 0):
-                    pointer.append(
-                        value.dtype.itemsize // np.dtype(nested_dtype.char + "1").itemsize,
-                    )
-                arr[field_name] = pointer
-                offset += len(data)
+                continue
+            nan_mask = None
+            # typed arrays cannot contain None-s
+            if is_str and (not isinstance(value, np.ndarray) or value.dtype == np.dtype(object)):
+                value = np.asarray(value, dtype=object)
+                if (none_mask := value == np.array([None])).any():
+                    nan_mask = none_mask
+            value = np.asarray(value, nested_dtype)
+            assert len(value.shape) == 1, "we don't support arrays of more than 1 dimension"
+            if nan_mask is not None:
+                if not value.flags.writeable:
+                    value = value.copy()
+                value[nan_mask] = ""
+            extra_bytes.append(data := value.view(np.byte).data)
+            pointer = [offset, len(value)]
+            if char_size:
+                pointer.append(value.dtype.itemsize // char_size)
+            arr[field_name] = pointer
+            offset += len(data)
         if not extra_bytes:
-            return cls(arr.view(np.byte).data)
+            return cls(arr.tobytes())
         return cls(b"".join(chain([arr.view(np.byte).data], extra_bytes)), **kwargs)
 
     @property
@@ -212,15 +205,19 @@ class NumpyStruct(Mapping[str, Any]):
 
     def __len__(self) -> int:
         """Implement len()."""
-        return len(self.dtype) + len(self.__slots__) - 2
+        return len(self.dtype) + len(self._optional_fields)
 
     def __iter__(self) -> Iterator[str]:
         """Implement iter()."""
-        return iter(chain(self.dtype.names, self.__slots__[2:]))
+        return iter(chain(self.dtype.names, self._optional_fields))
 
     def __hash__(self) -> int:
         """Implement hash()."""
-        return hash(self._data)
+        if isinstance(data := self._data, bytes):
+            # bytes cache their hash
+            return hash(data)
+        # writable memoryview-s and bytearray-s cannot be hashed
+        return hash(memoryview(data).tobytes())
 
     def __str__(self) -> str:
         """Format for human-readability."""
@@ -228,7 +225,7 @@ class NumpyStruct(Mapping[str, Any]):
 
     def __repr__(self) -> str:
         """Implement repr()."""
-        kwargs = {k: v for k in self.__slots__[2:] if (v := getattr(self, k)) is not None}
+        kwargs = {k: v for k in self._optional_fields if (v := getattr(self, k)) is not None}
         if kwargs:
             kwargs_str = ", ".join(f"{k}={repr(v)}" for k, v in kwargs.items()) + ", "
         else:
@@ -244,32 +241,48 @@ class NumpyStruct(Mapping[str, Any]):
         if self is other:
             return True
 
-        if self.__class__ is not other.__class__:
-            raise NotImplementedError(f"Cannot compare {self.__class__} and {other.__class__}")
+        if (self_type := type(self)) is not (other_type := type(other)):
+            raise NotImplementedError(f"Cannot compare {self_type} and {other_type}")
 
-        return self.data == other.data
+        return self._data == other._data
 
     def __getstate__(self) -> dict[str, Any]:
         """Support pickle.dump()."""
         data = self.data
         return {
             "data": bytes(data) if not isinstance(data, (bytes, bytearray)) else data,
-            **{attr: getattr(self, attr) for attr in self.__slots__[2:]},
+            **{attr: getattr(self, attr) for attr in self._optional_fields},
         }
 
     def __setstate__(self, state: dict[str, Any]):
         """Support pickle.load()."""
         self.__init__(**state)
 
+    def __reduce_ex__(self, protocol: int):
+        """Support pickle.dump() without copying `data` if the protocol is 5 or higher."""
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        return _unpickle_numpy_struct, (
+            type(self),
+            # read-only buffers are loaded as bytes, writable - as bytearray
+            pickle.PickleBuffer(memoryview(self._data).toreadonly()),
+            {attr: getattr(self, attr) for attr in self._optional_fields},
+        )
+
     def copy(self) -> "NumpyStruct":
         """Clone the instance."""
-        return type(self)(self.data, **{attr: getattr(self, attr) for attr in self.__slots__[2:]})
+        return type(self)(
+            self.data, **{attr: getattr(self, attr) for attr in self._optional_fields},
+        )
 
     @staticmethod
     def _generate_get(
         name: str,
         type_: Union[str, np.dtype, list[Union[str, np.dtype]]],
+        nested_dtype: Optional[Union[str, np.dtype, Callable]],
+        struct_dtype: np.dtype,
     ) -> Callable[["NumpyStruct"], Any]:
+        # resolve everything that does not depend on the instance in advance
         if _dtype_is_ascii(type_):
             type_ = str
         elif isinstance(type_, list):
@@ -281,31 +294,55 @@ class NumpyStruct(Mapping[str, Any]):
         elif char == "V":
             type_ = np.ndarray
 
-        def get_field(self) -> Optional[type_]:
-            if self._arr is None:
-                self._arr = np.frombuffer(self.data, self.dtype, count=1)
-            value = self._arr[name][0]
-            if (nested_dtype := self.nested_dtypes.get(name)) is None:
+        if nested_dtype is None:
+            decode = type_ is str
+            none_if_empty = type_ in (str, np.str_)
+
+            def get_field(self) -> Optional[type_]:
+                if (arr := self._arr) is None:
+                    arr = self._arr = np.frombuffer(self._data, struct_dtype, count=1)
+                value = arr[name][0]
                 if value != value:
                     return None
-                if type_ is str:
+                if decode:
                     value = value.decode()
-                if type_ in (str, np.str_):
+                if none_if_empty:
                     value = value or None
                 return value
-            if (_dtype_is_ascii(nested_dtype) and (char := "S")) or (
-                (char := nested_dtype.char) in ("S", "U") and nested_dtype.itemsize == 0
-            ):
-                offset, count, itemsize = value
-                nested_dtype = f"{char}{itemsize}"
-            else:
-                offset, count = value
-            return np.frombuffer(self.data, nested_dtype, offset=offset, count=count)
+
+        elif (_dtype_is_ascii(nested_dtype) and (char := "S")) or (
+            (char := nested_dtype.char) in ("S", "U") and nested_dtype.itemsize == 0
+        ):
+
+            def get_field(self) -> Optional[type_]:
+                if (arr := self._arr) is None:
+                    arr = self._arr = np.frombuffer(self._data, struct_dtype, count=1)
+                offset, count, itemsize = arr[name][0]
+                return np.frombuffer(self._data, f"{char}{itemsize}", offset=offset, count=count)
+
+        else:
+
+            def get_field(self) -> Optional[type_]:
+                if (arr := self._arr) is None:
+                    arr = self._arr = np.frombuffer(self._data, struct_dtype, count=1)
+                offset, count = arr[name][0]
+                return np.frombuffer(self._data, nested_dtype, offset=offset, count=count)
 
         get_field.__name__ = name
         return get_field
 
 
+def _unpickle_numpy_struct(
+    cls: type[NST],
+    data: Union[bytes, pickle.PickleBuffer],
+    optional: dict[str, Any],
+) -> NST:
+    if isinstance(data, pickle.PickleBuffer):
+        # out-of-band buffer
+        data = data.raw()
+    return cls(data, **optional)
+
+
 def _dtype_is_ascii(dtype: Union[str, np.dtype]) -> bool:
     return (dtype is ascii) or (isinstance(dtype, str) and dtype.startswith("ascii"))
 
@@ -340,6 +377,21 @@ def numpy_struct(cls):
         optional = cls.Optional.__annotations__
     except AttributeError:
         optional = {}
+    struct_dtype = np.dtype(dtype_tuples)
+    packing_plan = []
+    for k, (field_dtype, _) in struct_dtype.fields.items():
+        if (nested_dtype := nested_dtypes.get(k)) is None:
+            packing_plan.append((k, field_dtype, None, False, 0))
+            continue
+        if is_ascii := _dtype_is_ascii(nested_dtype):
+            nested_dtype = np.dtype("S")
+        is_str = is_ascii or nested_dtype.char in ("S", "U")
+        if is_str and (is_ascii or nested_dtype.itemsize == 0):
+            # we will save the characters count
+            char_size = np.dtype(nested_dtype.char + "1").itemsize
+        else:
+            char_size = 0
+        packing_plan.append((k, field_dtype, nested_dtype, is_str, char_size))
     field_names = NamedTuple(
         f"{cls.__name__}FieldNames",
         [(k, str) for k in chain(dtype, optional)],
@@ -347,12 +399,17 @@ def numpy_struct(cls):
     base = type(
         cls.__name__ + "Base",
         (NumpyStruct,),
-        {k: property(NumpyStruct._generate_get(k, v)) for k, v in dtype.items()},
+        {
+            k: property(NumpyStruct._generate_get(k, v, nested_dtypes.get(k), struct_dtype))
+            for k, v in dtype.items()
+        },
     )
     body = {
         "__slots__": ("_data", "_arr", *optional),
-        "dtype": np.dtype(dtype_tuples),
+        "dtype": struct_dtype,
         "nested_dtypes": nested_dtypes,
+        "_packing_plan": tuple(packing_plan),
+        "_optional_fields": tuple(optional),
         "f": field_names,
     }
     struct_cls = type(cls.__name__, (cls, base), body)
@@ -394,8 +451,8 @@ def df_from_structs(
                 columns[k] = [v]
         for item in items_iter:
             coerced_datas.append(item.coerced_data)
-            for k in columns:
-                columns[k].append(getattr(item, k))
+            for k, column in columns.items():
+                column.append(getattr(item, k))
         table_array = np.frombuffer(b"".join(coerced_datas), dtype=dtype)
         del coerced_datas
     else:
@@ -408,16 +465,17 @@ def df_from_structs(
         dtype = first_item.dtype
         nested_fields = first_item.nested_dtypes
         itemsize = dtype.itemsize
+        # np.frombuffer() below wraps this buffer without copying
         coerced_datas = bytearray(itemsize * length)
-        coerced_datas[:itemsize] = first_item.coerced_data
+        coerced_datas[:itemsize] = memoryview(first_item._data)[:itemsize]
         for k, v in first_item.items():
             if k not in dtype.names or k in nested_fields:
                 columns[k] = column = [None] * length
                 column[0] = v
         for i, item in enumerate(items_iter, 1):
-            coerced_datas[i * itemsize : (i + 1) * itemsize] = item.coerced_data
-            for k in columns:
-                columns[k][i] = item[k]
+            coerced_datas[i * itemsize : (i + 1) * itemsize] = memoryview(item._data)[:itemsize]
+            for k, column in columns.items():
+                column[i] = getattr(item, k)
         table_array = np.frombuffer(coerced_datas, dtype=dtype)
         del coerced_datas
     for field_name in dtype.names:
@@ -863,7 +863,7 @@ class TestCalcMetricsPRs:
         assert cm.calculated[0].values[0].values[0] == "3667053s"
         assert cm.calculated[0].for_.repositories == ["{1}"]
 
-    @pytest.mark.parametrize("repogroups", [[[0, 0]], [[0, -1]], [[0, 1]]])
+    @pytest.mark.parametrize("repogroups", [[[0, 0]], [[0, -1]], [[0, 1]], [[0, 2**64]]])
     async def test_groups_nasty(self, client, repogroups):
         """Two repository groups."""
         body = {
@@ -883,6 +883,25 @@ class TestCalcMetricsPRs:
         }
         await self._request(client, assert_status=400, json=body)
 
+    @pytest.mark.parametrize("lines", [[2**64, 10], [10, 2**64, 2**65, 100]])
+    async def test_lines_nasty(self, client, lines):
+        body = {
+            "for": [
+                {
+                    "with": {"author": ["github.com/vmarkovtsev", "github.com/mcuadros"]},
+                    "repositories": ["{1}"],
+                    "lines": lines,
+                },
+            ],
+            "metrics": [PullRequestMetricID.PR_OPENED],
+            "date_from": "2017-10-13",
+            "date_to": "2018-03-23",
+            "granularities": ["all"],
+            "exclude_inactive": False,
+            "account": 1,
+        }
+        await self._request(client, assert_status=400, json=body)
+
     # TODO: fix response validation against the schema
     @pytest.mark.app_validate_responses(False)
     async def test_lines_smoke(self, client):
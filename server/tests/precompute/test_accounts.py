@@ -1,4 +1,5 @@
 from argparse import Namespace
+import asyncio
 import contextlib
 import logging
 from typing import Any
@@ -8,7 +9,7 @@ from freezegun import freeze_time
 import sqlalchemy as sa
 
 from athenian.api.db import Database
-from athenian.api.defer import with_defer
+from athenian.api.defer import defer, wait_deferred, with_defer
 from athenian.api.internal.account import get_metadata_account_ids
 from athenian.api.internal.miners.github.bots import bots as fetch_bots
 from athenian.api.internal.prefixer import Prefixer
@@ -65,6 +66,104 @@ class TestMain:
         assert call_args_list[1][0][0].name == RepositorySet.ALL
         assert call_args_list[1][0][1] == (1012,)
 
+    @with_defer
+    async def test_concurrency(self, sdb, mdb, pdb, rdb, tqdm_disable) -> None:
+        await clear_all_accounts(sdb)
+        await models_insert(
+            sdb,
+            AccountFactory(id=11),
+            RepositorySetFactory(owner_id=11),
+            AccountFactory(id=12),
+            RepositorySetFactory(owner_id=12),
+            AccountGitHubAccount(id=1011, account_id=11),
+            AccountGitHubAccount(id=1012, account_id=12),
+        )
+        ctx = build_context(sdb=sdb, mdb=mdb, pdb=pdb, rdb=rdb)
+        namespace = _namespace(account=["11", "12"], disable_isolation=True, concurrency=2)
+        started = []
+        all_started = asyncio.Event()
+        finished = []
+
+        async def precompute(reposet, *_):
+            started.append(reposet.owner_id)
+            if len(started) == 2:
+                all_started.set()
+            # times out and fails the reposet if the other one is not running simultaneously
+            await asyncio.wait_for(all_started.wait(), 10)
+            finished.append(reposet.owner_id)
+
+        with mock.patch(f"{main.__module__}.precompute_reposet", new=precompute):
+            await main(ctx, namespace)
+
+        assert sorted(finished) == [11, 12]
+
+    @with_defer
+    async def test_concurrency_own_deferred(self, sdb, mdb, pdb, rdb, tqdm_disable) -> None:
+        await clear_all_accounts(sdb)
+        await models_insert(
+            sdb,
+            AccountFactory(id=11),
+            RepositorySetFactory(owner_id=11),
+            AccountFactory(id=12),
+            RepositorySetFactory(owner_id=12),
+            AccountGitHubAccount(id=1011, account_id=11),
+            AccountGitHubAccount(id=1012, account_id=12),
+        )
+        ctx = build_context(sdb=sdb, mdb=mdb, pdb=pdb, rdb=rdb)
+        namespace = _namespace(account=["11", "12"], disable_isolation=True, concurrency=2)
+        started = []
+        second_done = asyncio.Event()
+        finished = []
+
+        async def precompute(reposet, *_):
+            started.append(reposet.owner_id)
+            if len(started) == 1:
+                # blocks until the second reposet waits for its own deferred tasks
+                await defer(asyncio.wait_for(second_done.wait(), 10), "wait for the second")
+            else:
+                await defer(asyncio.sleep(0), "noop")
+            # times out if we wait for the deferred tasks of the other reposet
+            await asyncio.wait_for(wait_deferred(), 5)
+            if reposet.owner_id != started[0]:
+                second_done.set()
+            finished.append(reposet.owner_id)
+
+        with mock.patch(f"{main.__module__}.precompute_reposet", new=precompute):
+            await main(ctx, namespace)
+
+        assert sorted(finished) == [11, 12]
+
+    @with_defer
+    async def test_prefixer_warming_failure(self, sdb, mdb, pdb, rdb, cache, tqdm_disable) -> None:
+        await clear_all_accounts(sdb)
+        await models_insert(
+            sdb,
+            AccountFactory(id=11),
+            RepositorySetFactory(owner_id=11),
+            AccountFactory(id=12),
+            RepositorySetFactory(owner_id=12),
+            AccountGitHubAccount(id=1011, account_id=11),
+            AccountGitHubAccount(id=1012, account_id=12),
+        )
+        ctx = build_context(sdb=sdb, mdb=mdb, pdb=pdb, rdb=rdb, cache=cache)
+        namespace = _namespace(account=["11", "12"], disable_isolation=True)
+        warmed = []
+
+        async def load_prefixer(meta_ids, mdb, cache):
+            if meta_ids == (1011,):
+                raise ConnectionError("mdb is down")
+            warmed.append(meta_ids)
+
+        with (
+            mock.patch.object(Prefixer, "load", new=load_prefixer),
+            mock.patch(f"{main.__module__}.precompute_reposet") as precompute_mock,
+        ):
+            await main(ctx, namespace)
+
+        assert warmed == [(1012,)]
+        assert precompute_mock.call_count == 2
+        assert sorted(call[0][0].owner_id for call in precompute_mock.call_args_list) == [11, 12]
+
     @with_defer
     async def test_not_installed_account(self, sdb, mdb, pdb, rdb, tqdm_disable) -> None:
         await clear_all_accounts(sdb)
@@ -223,6 +322,7 @@ def _namespace(**kwargs: Any) -> Namespace:
     kwargs.setdefault("skip_jira", True)
     kwargs.setdefault("prometheus_pushgateway", None)
     kwargs.setdefault("timeout", 1000)
+    kwargs.setdefault("concurrency", 1)
     return Namespace(**kwargs)
 
 
@@ -0,0 +1,42 @@
+from argparse import Namespace
+import logging
+from unittest import mock
+
+import pytest
+
+from athenian.api.db import measure_db_overhead_and_retry
+from athenian.api.precompute.context import PrecomputeContext
+from tests.conftest import build_fake_cache
+
+
+class TestCreate:
+    @pytest.mark.parametrize("no_db_retry, wrapped_count", [(False, 4), (True, 0)])
+    async def test_db_retry(
+        self,
+        metadata_db: str,
+        state_db: str,
+        precomputed_db: str,
+        persistentdata_db: str,
+        no_db_retry: bool,
+        wrapped_count: int,
+    ) -> None:
+        args = Namespace(
+            memcached=None,
+            metadata_db=metadata_db,
+            state_db=state_db,
+            precomputed_db=precomputed_db,
+            persistentdata_db=persistentdata_db,
+            no_db_retry=no_db_retry,
+        )
+        module = PrecomputeContext.__module__
+        with (
+            mock.patch(f"{module}.create_memcached", return_value=build_fake_cache()),
+            mock.patch(
+                f"{module}.measure_db_overhead_and_retry", wraps=measure_db_overhead_and_retry,
+            ) as wrap_mock,
+        ):
+            context = await PrecomputeContext.create(args, logging.getLogger(__name__))
+        try:
+            assert wrap_mock.call_count == wrapped_count
+        finally:
+            await context.close()
@@ -86,6 +86,28 @@ class TestMain:
             expires=dt(2022, 1, 4, 14, 30),
         )
 
+    @freeze_time("2022-01-03T15:00:00")
+    async def test_multiple_admin_users(self, sdb, mdb) -> None:
+        await sdb.execute(sa.delete(AccountGitHubAccount))
+        await models_insert(
+            sdb,
+            AccountFactory(id=5, expires_at=dt(2022, 1, 4, 14, 30)),
+            UserAccountFactory(user_id="u501", account_id=5),
+            UserAccountFactory(user_id="u500", account_id=5),
+            AccountGitHubAccountFactory(id=self._MDB_GH_ACCOUNT_ID, account_id=5),
+        )
+        slack_mock = self._slack_mock()
+        ctx = build_context(sdb=sdb, mdb=mdb, slack=slack_mock)
+        await main(ctx, Namespace())
+
+        slack_mock.post_account.assert_called_once_with(
+            "almost_expired.jinja2",
+            account=5,
+            name="athenianco",
+            user="u500, u501",
+            expires=dt(2022, 1, 4, 14, 30),
+        )
+
     @classmethod
     def _slack_mock(cls) -> mock.Mock:
         slack_mock = mock.Mock(spec=SlackWebClient)
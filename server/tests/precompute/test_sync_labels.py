@@ -0,0 +1,114 @@
+from argparse import Namespace
+from collections import defaultdict
+from unittest import mock
+
+import sqlalchemy as sa
+
+from athenian.api.db import Database
+from athenian.api.models.metadata.github import NodePullRequest, PullRequestLabel
+from athenian.api.models.precomputed.models import GitHubDonePullRequestFacts
+from athenian.api.precompute import sync_labels
+from athenian.api.precompute.sync_labels import main
+from tests.testutils.db import models_insert
+from tests.testutils.factory.common import DEFAULT_MD_ACCOUNT_ID
+from tests.testutils.factory.precomputed import GitHubDonePullRequestFactsFactory
+
+from .conftest import build_context
+
+
+class TestMain:
+    async def test_changed_labels(self, mdb: Database, pdb: Database) -> None:
+        labels = await _load_mdb_labels(mdb)
+        node_id = min(labels)
+        await models_insert(
+            pdb, GitHubDonePullRequestFactsFactory(pr_node_id=node_id, labels={"stale": ""}),
+        )
+        await main(build_context(mdb=mdb, pdb=pdb), Namespace())
+
+        assert await _load_pdb_labels(pdb) == {node_id: labels[node_id]}
+
+    async def test_unchanged_labels(self, mdb: Database, pdb: Database) -> None:
+        labels = await _load_mdb_labels(mdb)
+        node_id = min(labels)
+        await models_insert(
+            pdb,
+            GitHubDonePullRequestFactsFactory(
+                pr_node_id=node_id, labels=dict.fromkeys(labels[node_id], ""),
+            ),
+        )
+        with mock.patch.object(pdb, "execute", wraps=pdb.execute) as execute_mock:
+            await main(build_context(mdb=mdb, pdb=pdb), Namespace())
+
+        execute_mock.assert_not_called()
+        assert await _load_pdb_labels(pdb) == {node_id: labels[node_id]}
+
+    async def test_removed_labels(self, mdb: Database, pdb: Database) -> None:
+        node_id = (await _load_mdb_unlabeled_prs(mdb))[0]
+        await models_insert(
+            pdb,
+            GitHubDonePullRequestFactsFactory(pr_node_id=node_id, labels={"bug": "", "ux": ""}),
+        )
+        await main(build_context(mdb=mdb, pdb=pdb), Namespace())
+
+        assert await _load_pdb_labels(pdb) == {node_id: frozenset()}
+
+    async def test_multiple_chunks(self, mdb: Database, pdb: Database) -> None:
+        unlabeled = (await _load_mdb_unlabeled_prs(mdb))[:5]
+        assert len(unlabeled) == 5
+        await models_insert(
+            pdb,
+            *(
+                GitHubDonePullRequestFactsFactory(pr_node_id=node_id, labels={"stale": ""})
+                for node_id in unlabeled
+            ),
+        )
+        with (
+            mock.patch.object(sync_labels, "update_chunk_size", 2),
+            mock.patch.object(pdb, "execute", wraps=pdb.execute) as execute_mock,
+        ):
+            await main(build_context(mdb=mdb, pdb=pdb), Namespace())
+
+        # the PRs share the same new label set, so they are only split by the chunk size
+        assert execute_mock.call_count == 3
+        assert await _load_pdb_labels(pdb) == {node_id: frozenset() for node_id in unlabeled}
+
+
+async def _load_mdb_labels(mdb: Database) -> dict[int, frozenset[str]]:
+    rows = await mdb.fetch_all(
+        sa.select([PullRequestLabel.pull_request_node_id, PullRequestLabel.name]).where(
+            PullRequestLabel.acc_id == DEFAULT_MD_ACCOUNT_ID,
+        ),
+    )
+    labels = defaultdict(set)
+    for row in rows:
+        labels[row[PullRequestLabel.pull_request_node_id.name]].add(
+            row[PullRequestLabel.name.name].lower(),
+        )
+    return {node_id: frozenset(names) for node_id, names in labels.items()}
+
+
+async def _load_mdb_unlabeled_prs(mdb: Database) -> list[int]:
+    labeled = sa.select([PullRequestLabel.pull_request_node_id]).where(
+        PullRequestLabel.acc_id == DEFAULT_MD_ACCOUNT_ID,
+    )
+    rows = await mdb.fetch_all(
+        sa.select([NodePullRequest.id])
+        .where(
+            NodePullRequest.acc_id == DEFAULT_MD_ACCOUNT_ID,
+            NodePullRequest.id.notin_(labeled),
+        )
+        .order_by(NodePullRequest.id),
+    )
+    return [row[0] for row in rows]
+
+
+async def _load_pdb_labels(pdb: Database) -> dict[int, frozenset[str]]:
+    rows = await pdb.fetch_all(
+        sa.select([GitHubDonePullRequestFacts.pr_node_id, GitHubDonePullRequestFacts.labels]),
+    )
+    return {
+        row[GitHubDonePullRequestFacts.pr_node_id.name]: frozenset(
+            row[GitHubDonePullRequestFacts.labels.name],
+        )
+        for row in rows
+    }